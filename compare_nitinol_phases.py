@@ -8,11 +8,23 @@ structures are always displayed consistently. To change how the structures
 look, modify the values in SHARED_PARAMS at the top of the file.
 """
 
+import argparse
+import functools
+
 from ase import Atoms
+from ase.cell import Cell
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from matplotlib.widgets import CheckButtons
 import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import pdist
+
+try:
+    import numba
+except ImportError:  # Numba is optional - only used to speed up large structures
+    numba = None
 
 # Shared visualization parameters - ensures both structures are always identical
 SHARED_PARAMS = {
@@ -26,7 +38,8 @@ SHARED_PARAMS = {
     'bond_distance': 3.2,      # Maximum bond distance in Angstroms
     'atom_size': 300,          # Size of atom spheres
     'bond_width': 1.5,         # Width of bond lines
-    'bond_alpha': 0.4          # Transparency of bonds (0=transparent, 1=opaque)
+    'bond_color': '#cccccc',   # Light gray - looks like translucent gray without slow alpha blending
+    'bond_alpha': 1.0          # Transparency of bonds (0=transparent, 1=opaque)
 }
 
 # Note: B2 has 2 atoms per unit cell, B19' has 4 atoms per unit cell
@@ -34,10 +47,67 @@ SHARED_PARAMS = {
 # B2 atoms = repetitions_b2[0] * repetitions_b2[1] * repetitions_b2[2] * 2
 # B19 atoms = repetitions_b19[0] * repetitions_b19[1] * repetitions_b19[2] * 4
 
-def create_b2_austenite():
+# Unit cell corners in fractional coordinates, ordered so that corner
+# index = 4*i + 2*j + k for fractional position (i, j, k)
+CELL_CORNERS = np.array([[i, j, k] for i in (0, 1) for j in (0, 1) for k in (0, 1)])
+
+# Pairs of corner indices joined by the 12 edges of the unit cell
+EDGE_INDICES = np.array([(0, 1), (0, 2), (0, 4), (1, 3), (1, 5), (2, 3),
+                         (2, 6), (4, 5), (4, 6), (3, 7), (5, 7), (6, 7)])
+
+# Structures with more atoms than this use a KD-tree neighbor search for bonds
+# (unless the Numba search below applies)
+KDTREE_ATOM_THRESHOLD = 256
+
+# Structures with at least this many atoms use the Numba bond search (if installed)
+NUMBA_MIN_ATOMS = 1000
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _find_bonds_numba(positions, max_bond_distance_sq):
+        """
+        Scan the upper triangle of atom pairs without building a distance matrix
+
+        Runs in two passes: first count the bonds of every atom, then fill
+        the output arrays at offsets given by the running total of the counts.
+        """
+        n = positions.shape[0]
+
+        counts = np.zeros(n, dtype=np.int64)
+        for i in numba.prange(n):
+            count = 0
+            for j in range(i + 1, n):
+                dx = positions[i, 0] - positions[j, 0]
+                dy = positions[i, 1] - positions[j, 1]
+                dz = positions[i, 2] - positions[j, 2]
+                if dx*dx + dy*dy + dz*dz < max_bond_distance_sq:
+                    count += 1
+            counts[i] = count
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+
+        bond_i = np.empty(offsets[n], dtype=np.int64)
+        bond_j = np.empty(offsets[n], dtype=np.int64)
+        for i in numba.prange(n):
+            k = offsets[i]
+            for j in range(i + 1, n):
+                dx = positions[i, 0] - positions[j, 0]
+                dy = positions[i, 1] - positions[j, 1]
+                dz = positions[i, 2] - positions[j, 2]
+                if dx*dx + dy*dy + dz*dz < max_bond_distance_sq:
+                    bond_i[k] = i
+                    bond_j[k] = j
+                    k += 1
+
+        return bond_i, bond_j
+
+@functools.lru_cache(maxsize=None)
+def _build_b2_arrays(repetitions):
     """
-    Create B2 austenite phase unit cell
-    CsCl-type body-centered cubic structure
+    Build the repeated B2 structure as (positions, symbols, cell) arrays
+
+    Cached on the repetition tuple so the structure is only built once.
     """
     a = 3.015  # Lattice parameter in Angstrom
 
@@ -50,23 +120,14 @@ def create_b2_austenite():
 
     symbols = ['Ti', 'Ni']
 
-    b2 = Atoms(symbols=symbols,
-               positions=positions,
-               cell=cell,
-               pbc=True)
+    return _repeat_unit_cell(positions, symbols, cell, repetitions)
 
-    # Use shared repetition parameters
-    b2 = b2.repeat(SHARED_PARAMS['repetitions_b2'])
-
-    return b2
-
-def create_b19_martensite():
+@functools.lru_cache(maxsize=None)
+def _build_b19_arrays(repetitions):
     """
-    Create B19' martensite phase unit cell
-    Monoclinic structure (approximate)
+    Build the repeated B19' structure as (positions, symbols, cell) arrays
 
-    B19' has monoclinic symmetry with:
-    a ≈ 2.89 Å, b ≈ 4.12 Å, c ≈ 4.62 Å, β ≈ 96.8°
+    Cached on the repetition tuple so the structure is only built once.
     """
     a = 2.89
     b = 4.12
@@ -89,79 +150,205 @@ def create_b19_martensite():
 
     symbols = ['Ti', 'Ni', 'Ti', 'Ni']
 
-    b19 = Atoms(symbols=symbols,
-                positions=positions,
-                cell=cell,
-                pbc=True)
+    return _repeat_unit_cell(positions, symbols, cell, repetitions)
 
-    # Use shared repetition parameters
-    b19 = b19.repeat(SHARED_PARAMS['repetitions_b19'])
+def _repeat_unit_cell(positions, symbols, cell, repetitions):
+    """
+    Repeat a unit cell along its three cell vectors in one vectorized step
+
+    Gives the same atom order and supercell as ase.Atoms.repeat, without
+    looping over cell translations in Python. The returned arrays are
+    read-only so cached results can't be modified.
+
+    Parameters:
+    -----------
+    positions : list
+        Atom positions in the unit cell, shape (M, 3)
+    symbols : list
+        Chemical symbols of the M atoms
+    cell : list
+        Unit cell vectors, shape (3, 3)
+    repetitions : tuple
+        Number of unit cells along each cell vector
+
+    Returns:
+    --------
+    positions, symbols, cell : numpy.ndarray
+        Supercell atom positions (N, 3), symbols (N,) and cell vectors (3, 3)
+    """
+    positions = np.asarray(positions, dtype=float)
+    cell = np.asarray(cell, dtype=float)
+
+    # Integer index (i, j, k) of every unit cell, ordered like ase.Atoms.repeat
+    ix, iy, iz = np.meshgrid(np.arange(repetitions[0]),
+                             np.arange(repetitions[1]),
+                             np.arange(repetitions[2]), indexing='ij')
+    translations = np.stack([ix.ravel(), iy.ravel(), iz.ravel()], axis=1) @ cell
+
+    arrays = ((translations[:, None, :] + positions[None, :, :]).reshape(-1, 3),
+              np.tile(symbols, len(translations)),
+              cell * np.asarray(repetitions)[:, None])
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+def create_b2_arrays():
+    """
+    Create B2 austenite phase as raw (positions, symbols, cell) arrays
+    using the shared repetition parameters
+    """
+    return _build_b2_arrays(tuple(SHARED_PARAMS['repetitions_b2']))
 
-    return b19
+def create_b19_arrays():
+    """
+    Create B19' martensite phase as raw (positions, symbols, cell) arrays
+    using the shared repetition parameters
+    """
+    return _build_b19_arrays(tuple(SHARED_PARAMS['repetitions_b19']))
 
-def plot_structure(atoms, ax, title):
+def create_b2_austenite():
     """
-    Plot atomic structure on given matplotlib axis with bonds
+    Create B2 austenite phase unit cell
+    CsCl-type body-centered cubic structure
     """
-    positions = atoms.get_positions()
-    symbols = atoms.get_chemical_symbols()
+    positions, symbols, cell = create_b2_arrays()
 
-    # Draw bonds first (so they appear behind atoms)
-    # Use shared bond parameters
+    return Atoms(symbols=symbols.tolist(),
+                 positions=positions,
+                 cell=cell,
+                 pbc=True)
+
+def create_b19_martensite():
+    """
+    Create B19' martensite phase unit cell
+    Monoclinic structure (approximate)
+
+    B19' has monoclinic symmetry with:
+    a ≈ 2.89 Å, b ≈ 4.12 Å, c ≈ 4.62 Å, β ≈ 96.8°
+    """
+    positions, symbols, cell = create_b19_arrays()
+
+    return Atoms(symbols=symbols.tolist(),
+                 positions=positions,
+                 cell=cell,
+                 pbc=True)
+
+def find_bonds(positions, max_bond_distance):
+    """
+    Find all pairs of atoms strictly closer together than max_bond_distance
+
+    Pairs exactly max_bond_distance apart are not bonded. The search method
+    depends on the structure size:
+      - NUMBA_MIN_ATOMS or more atoms with Numba installed: parallel Numba scan
+      - more than KDTREE_ATOM_THRESHOLD atoms: KD-tree neighbor search
+      - otherwise: dense pairwise distances with pdist
+
+    Parameters:
+    -----------
+    positions : numpy.ndarray
+        Atom positions, shape (N, 3)
+    max_bond_distance : float
+        Maximum bond distance in Angstroms
+
+    Returns:
+    --------
+    bond_i, bond_j : numpy.ndarray
+        Indices of the two atoms of each bond, with bond_i < bond_j
+    """
+    # Compare squared distances, so no square roots are taken; bond lengths
+    # themselves are never needed
+    max_bond_distance_sq = max_bond_distance * max_bond_distance
+
+    # Very large structures: scan all pairs in parallel without any N x N
+    # temporary (only when Numba is installed)
+    if numba is not None and len(positions) >= NUMBA_MIN_ATOMS:
+        return _find_bonds_numba(np.ascontiguousarray(positions, dtype=np.float64),
+                                 max_bond_distance_sq)
+
+    # Large structures (or very large ones without Numba): a fixed-radius
+    # KD-tree search (O(N log N)) beats checking every pair (O(N^2))
+    if len(positions) > KDTREE_ATOM_THRESHOLD:
+        pairs = cKDTree(positions).query_pairs(r=max_bond_distance, output_type='ndarray')
+        pair_i, pair_j = pairs[:, 0], pairs[:, 1]
+
+        # query_pairs also returns pairs exactly max_bond_distance apart;
+        # drop them so both paths find the same bonds
+        diff = positions[pair_i] - positions[pair_j]
+        bonded = np.einsum('ij,ij->i', diff, diff) < max_bond_distance_sq
+        return pair_i[bonded], pair_j[bonded]
+
+    # Compute all pairwise squared distances in compiled code; pdist returns
+    # the condensed upper triangle, matching the order of np.triu_indices
+    dist_sq = pdist(positions, 'sqeuclidean')
+    pair_i, pair_j = np.triu_indices(len(positions), k=1)
+
+    # Only keep bonds between nearest neighbors
+    bonded = dist_sq < max_bond_distance_sq
+    return pair_i[bonded], pair_j[bonded]
+
+def plot_structure(positions, symbols, cell, ax, title):
+    """
+    Plot atomic structure on given matplotlib axis with bonds
+
+    Parameters:
+    -----------
+    positions : numpy.ndarray
+        Atom positions, shape (N, 3)
+    symbols : numpy.ndarray or list
+        Chemical symbols of the N atoms
+    cell : numpy.ndarray
+        Cell vectors, shape (3, 3)
+    ax : Axes3D
+        Axis to draw on
+    title : str
+        Plot title
+    """
+    # Look up shared parameters once
     max_bond_distance = SHARED_PARAMS['bond_distance']
+    bond_width = SHARED_PARAMS['bond_width']
+    bond_color = SHARED_PARAMS['bond_color']
+    bond_alpha = SHARED_PARAMS['bond_alpha']
+    atom_size = SHARED_PARAMS['atom_size']
+
+    # Draw artists in zorder instead of re-sorting them by depth on every
+    # redraw (bonds use zorder 1, atoms zorder 3)
+    ax.computed_zorder = False
 
-    for i in range(len(positions)):
-        for j in range(i + 1, len(positions)):
-            distance = np.linalg.norm(positions[i] - positions[j])
+    # Draw bonds first (so they appear behind atoms)
+    bond_i, bond_j = find_bonds(positions, max_bond_distance)
 
-            # Only draw bonds between nearest neighbors
-            if distance < max_bond_distance:
-                # Draw bond as a line
-                bond_points = np.array([positions[i], positions[j]])
-                ax.plot3D(bond_points[:, 0], bond_points[:, 1], bond_points[:, 2],
-                         'gray', linewidth=SHARED_PARAMS['bond_width'],
-                         alpha=SHARED_PARAMS['bond_alpha'], zorder=1)
+    # Draw all bonds as a single line collection (one artist instead of one per bond)
+    if len(bond_i) > 0:
+        bond_segments = np.stack([positions[bond_i], positions[bond_j]], axis=1)
+        ax.add_collection3d(Line3DCollection(bond_segments, colors=bond_color,
+                                             linewidths=bond_width,
+                                             alpha=bond_alpha, zorder=1))
 
-    # Separate Ti and Ni atoms
-    ti_pos = positions[np.array(symbols) == 'Ti']
-    ni_pos = positions[np.array(symbols) == 'Ni']
+    # Separate Ti and Ni atoms (every atom is one or the other, so a single
+    # comparison gives both masks)
+    ti_mask = np.asarray(symbols) == 'Ti'
+    ti_pos = positions[ti_mask]
+    ni_pos = positions[~ti_mask]
 
     # Plot atoms (with higher zorder so they appear on top of bonds)
-    # Use shared atom size parameter
+    # Atoms are fully opaque: alpha is 1 and depth shading (which fades the
+    # back atoms by lowering their alpha on every redraw) is turned off
     if len(ti_pos) > 0:
         ax.scatter(ti_pos[:, 0], ti_pos[:, 1], ti_pos[:, 2],
-                  c='silver', s=SHARED_PARAMS['atom_size'], alpha=0.9, edgecolors='black',
-                  linewidths=1.5, label='Ti', zorder=3)
+                  c='silver', s=atom_size, alpha=1.0, edgecolors='black',
+                  linewidths=1.5, label='Ti', zorder=3, depthshade=False)
 
     if len(ni_pos) > 0:
         ax.scatter(ni_pos[:, 0], ni_pos[:, 1], ni_pos[:, 2],
-                  c='gold', s=SHARED_PARAMS['atom_size'], alpha=0.9, edgecolors='black',
-                  linewidths=1.5, label='Ni', zorder=3)
+                  c='gold', s=atom_size, alpha=1.0, edgecolors='black',
+                  linewidths=1.5, label='Ni', zorder=3, depthshade=False)
 
     # Draw unit cell
-    cell = atoms.get_cell()
-
-    # Define edges of the cell
-    origin = [0, 0, 0]
-    edges = [
-        [origin, cell[0]],
-        [origin, cell[1]],
-        [origin, cell[2]],
-        [cell[0], cell[0] + cell[1]],
-        [cell[0], cell[0] + cell[2]],
-        [cell[1], cell[1] + cell[0]],
-        [cell[1], cell[1] + cell[2]],
-        [cell[2], cell[2] + cell[0]],
-        [cell[2], cell[2] + cell[1]],
-        [cell[0] + cell[1], cell[0] + cell[1] + cell[2]],
-        [cell[0] + cell[2], cell[0] + cell[2] + cell[1]],
-        [cell[1] + cell[2], cell[1] + cell[2] + cell[0]]
-    ]
+    # Build all 12 edges as a single (12, 2, 3) array of segment end points
+    corners = CELL_CORNERS @ cell
+    edges = corners[EDGE_INDICES]
 
-    for edge in edges:
-        points = np.array(edge)
-        ax.plot3D(points[:, 0], points[:, 1], points[:, 2],
-                 'b-', linewidth=1, alpha=0.3)
+    ax.add_collection3d(Line3DCollection(edges, colors='b', linewidths=1, alpha=0.3))
 
     ax.set_xlabel('X (Å)', fontsize=10)
     ax.set_ylabel('Y (Å)', fontsize=10)
@@ -170,13 +357,11 @@ def plot_structure(atoms, ax, title):
     ax.legend(loc='upper right', fontsize=10)
 
     # Set equal aspect ratio
-    max_range = np.array([positions[:, 0].max() - positions[:, 0].min(),
-                         positions[:, 1].max() - positions[:, 1].min(),
-                         positions[:, 2].max() - positions[:, 2].min()]).max() / 2.0
+    pos_min = positions.min(axis=0)
+    pos_max = positions.max(axis=0)
+    max_range = (pos_max - pos_min).max() / 2.0
 
-    mid_x = (positions[:, 0].max() + positions[:, 0].min()) * 0.5
-    mid_y = (positions[:, 1].max() + positions[:, 1].min()) * 0.5
-    mid_z = (positions[:, 2].max() + positions[:, 2].min()) * 0.5
+    mid_x, mid_y, mid_z = (pos_max + pos_min) * 0.5
 
     ax.set_xlim(mid_x - max_range, mid_x + max_range)
     ax.set_ylim(mid_y - max_range, mid_y + max_range)
@@ -184,47 +369,62 @@ def plot_structure(atoms, ax, title):
 
     ax.view_init(elev=20, azim=45)
 
-def visualize_comparison():
-    """Create side-by-side comparison of B2 and B19' phases with interactive controls"""
+def visualize_comparison(save=False, dpi=150):
+    """
+    Create side-by-side comparison of B2 and B19' phases with interactive controls
+
+    Parameters:
+    -----------
+    save : bool
+        Save the comparison to a PNG image before displaying it
+    dpi : int
+        Resolution of the saved image (only used when save is True)
+    """
 
+    # Work with the raw arrays directly - plotting doesn't need Atoms objects
     print("Creating B2 austenite structure...")
-    b2 = create_b2_austenite()
-    print(f"  B2 phase: {len(b2)} atoms")
-    print(f"  Cell parameters: a=b=c={b2.cell.cellpar()[0]:.3f} Å (cubic)")
+    b2_positions, b2_symbols, b2_cell = create_b2_arrays()
+    print(f"  B2 phase: {len(b2_positions)} atoms")
+    print(f"  Cell parameters: a=b=c={Cell(b2_cell).cellpar()[0]:.3f} Å (cubic)")
 
     print("\nCreating B19' martensite structure...")
-    b19 = create_b19_martensite()
-    print(f"  B19' phase: {len(b19)} atoms")
-    cell_params = b19.cell.cellpar()
+    b19_positions, b19_symbols, b19_cell = create_b19_arrays()
+    print(f"  B19' phase: {len(b19_positions)} atoms")
+    cell_params = Cell(b19_cell).cellpar()
     print(f"  Cell parameters: a={cell_params[0]:.3f} Å, b={cell_params[1]:.3f} Å, c={cell_params[2]:.3f} Å")
     print(f"  Monoclinic angle β={cell_params[4]:.1f}°")
 
     # Validate that both structures have the same number of atoms
-    if len(b2) != len(b19):
+    if len(b2_positions) != len(b19_positions):
         raise ValueError(
-            f"ERROR: Atom count mismatch! B2 has {len(b2)} atoms but B19' has {len(b19)} atoms.\n"
+            f"ERROR: Atom count mismatch! B2 has {len(b2_positions)} atoms but B19' has {len(b19_positions)} atoms.\n"
             f"Both structures must have exactly {SHARED_PARAMS['num_atoms']} atoms.\n"
             f"Please adjust repetitions_b2 or repetitions_b19 in SHARED_PARAMS."
         )
 
-    if len(b2) != SHARED_PARAMS['num_atoms']:
+    if len(b2_positions) != SHARED_PARAMS['num_atoms']:
         raise ValueError(
-            f"ERROR: Atom count mismatch! Structures have {len(b2)} atoms but SHARED_PARAMS specifies {SHARED_PARAMS['num_atoms']}.\n"
+            f"ERROR: Atom count mismatch! Structures have {len(b2_positions)} atoms but SHARED_PARAMS specifies {SHARED_PARAMS['num_atoms']}.\n"
             f"Please adjust repetitions to match num_atoms in SHARED_PARAMS."
         )
 
-    print(f"\n✓ Validation passed: Both structures have exactly {len(b2)} atoms")
+    print(f"\n✓ Validation passed: Both structures have exactly {len(b2_positions)} atoms")
 
     # Create figure with two subplots and space for controls
-    fig = plt.figure(figsize=(17, 7))
+    # Constrained layout is computed as part of each draw, so no separate
+    # tight_layout pass is needed
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(17, 7),
+                                   subplot_kw={'projection': '3d'},
+                                   constrained_layout=True)
+    fig.get_layout_engine().set(rect=(0, 0.05, 1, 0.95))
 
     # B2 Austenite
-    ax1 = fig.add_subplot(121, projection='3d')
-    plot_structure(b2, ax1, 'B2 Austenite (High Temperature)\nCubic - "Memory" Phase')
+    plot_structure(b2_positions, b2_symbols, b2_cell, ax1,
+                   'B2 Austenite (High Temperature)\nCubic - "Memory" Phase')
 
     # B19' Martensite
-    ax2 = fig.add_subplot(122, projection='3d')
-    plot_structure(b19, ax2, "B19' Martensite (Low Temperature)\nMonoclinic - Deformable Phase")
+    plot_structure(b19_positions, b19_symbols, b19_cell, ax2,
+                   "B19' Martensite (Low Temperature)\nMonoclinic - Deformable Phase")
 
     # Set both to the same initial viewing angle using shared parameters
     ax1.view_init(elev=SHARED_PARAMS['initial_view']['elev'],
@@ -233,7 +433,7 @@ def visualize_comparison():
                   azim=SHARED_PARAMS['initial_view']['azim'])
 
     plt.suptitle('Nitinol Crystal Structure Comparison',
-                fontsize=16, fontweight='bold', y=0.98)
+                fontsize=16, fontweight='bold')
 
     # Add interactive controls
     # Create checkbox area at the bottom
@@ -245,7 +445,9 @@ def visualize_comparison():
     state = {
         'lock_rotation': False,
         'show_grid': True,
-        'show_legends': True
+        'show_legends': True,
+        'sync_dirty': False,       # A locked rotation is waiting to be synced
+        'sync_source': None        # Axis the user is currently rotating
     }
 
     def on_checkbox_clicked(label):
@@ -256,6 +458,11 @@ def visualize_comparison():
                 # Sync the views
                 ax2.view_init(elev=ax1.elev, azim=ax1.azim)
                 fig.canvas.draw_idle()
+                sync_timer.start()
+            else:
+                # Only poll for rotation syncs while locked
+                sync_timer.stop()
+                state['sync_dirty'] = False
 
         elif label == 'Show Grid':
             state['show_grid'] = not state['show_grid']
@@ -281,24 +488,38 @@ def visualize_comparison():
 
     # Store the original motion_notify_event handler
     def on_move(event):
-        """Synchronize rotation when locked"""
+        """Mark the rotation for syncing when locked (applied by sync_rotation)"""
         if state['lock_rotation'] and event.inaxes in [ax1, ax2]:
-            # Get the view angles from the active axis
-            if event.inaxes == ax1:
-                ax2.view_init(elev=ax1.elev, azim=ax1.azim)
-            elif event.inaxes == ax2:
-                ax1.view_init(elev=ax2.elev, azim=ax2.azim)
-            fig.canvas.draw_idle()
+            state['sync_source'] = event.inaxes
+            state['sync_dirty'] = True
+
+    def sync_rotation():
+        """Synchronize rotation when locked, at most once per timer tick"""
+        if not state['sync_dirty']:
+            return
+        state['sync_dirty'] = False
+
+        # Get the view angles from the active axis
+        if state['sync_source'] == ax1:
+            ax2.view_init(elev=ax1.elev, azim=ax1.azim)
+        else:
+            ax1.view_init(elev=ax2.elev, azim=ax2.azim)
+        fig.canvas.draw_idle()
 
     # Connect the motion event
     fig.canvas.mpl_connect('motion_notify_event', on_move)
 
-    plt.tight_layout(rect=[0, 0.05, 1, 0.96])
+    # Coalesce mouse moves into at most ~30 redraws per second; the timer
+    # only runs while Lock Rotation is on (see on_checkbox_clicked)
+    sync_timer = fig.canvas.new_timer(interval=33)
+    sync_timer.add_callback(sync_rotation)
 
-    # Save figure
-    output_file = 'nitinol_phase_comparison.png'
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    print(f"\nSaved comparison image to: {output_file}")
+    # Save figure only when requested - rendering the scene for export is
+    # slow and not needed for the interactive viewer
+    if save:
+        output_file = 'nitinol_phase_comparison.png'
+        plt.savefig(output_file, dpi=dpi)
+        print(f"\nSaved comparison image to: {output_file}")
 
     # Show interactive plot
     print("Displaying interactive comparison...")
@@ -309,4 +530,11 @@ def visualize_comparison():
     plt.show()
 
 if __name__ == "__main__":
-    visualize_comparison()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--save', action='store_true',
+                        help='save the comparison to nitinol_phase_comparison.png')
+    parser.add_argument('--dpi', type=int, default=150,
+                        help='resolution of the saved image (default: 150)')
+    args = parser.parse_args()
+
+    visualize_comparison(save=args.save, dpi=args.dpi)
@@ -58,13 +58,19 @@ def create_nitinol_wire(length=20, diameter=10):
     center_y = wire.cell[1][1] / 2
     radius = diameter / 2
 
+    # Compare squared distances so no square root is needed
     positions = wire.get_positions()
-    distances = np.sqrt((positions[:, 0] - center_x)**2 +
-                       (positions[:, 1] - center_y)**2)
-
-    # Keep only atoms within cylindrical radius
-    mask = distances <= radius
-    wire = wire[mask]
+    distances_sq = ((positions[:, 0] - center_x)**2 +
+                    (positions[:, 1] - center_y)**2)
+
+    # Keep only atoms within cylindrical radius, building the new Atoms
+    # directly from the filtered arrays instead of indexing the Atoms object
+    mask = distances_sq <= radius * radius
+    symbols = np.asarray(wire.get_chemical_symbols())
+    wire = Atoms(symbols=symbols[mask].tolist(),
+                 positions=positions[mask],
+                 cell=wire.cell,
+                 pbc=wire.pbc)
 
     return wire
 
@@ -74,9 +80,14 @@ def visualize_nitinol():
     print("Creating nitinol wire structure...")
     wire = create_nitinol_wire(length=30, diameter=15)
 
+    # Count atoms from the symbols array rather than iterating Atom objects
+    symbols = np.asarray(wire.get_chemical_symbols())
+    n_ti = np.count_nonzero(symbols == 'Ti')
+    n_ni = symbols.size - n_ti
+
     print(f"Wire created with {len(wire)} atoms")
-    print(f"  Ti atoms: {sum(1 for atom in wire if atom.symbol == 'Ti')}")
-    print(f"  Ni atoms: {sum(1 for atom in wire if atom.symbol == 'Ni')}")
+    print(f"  Ti atoms: {n_ti}")
+    print(f"  Ni atoms: {n_ni}")
     print(f"\nWire dimensions:")
     print(f"  Cell: {wire.cell.cellpar()[:3]} Angstrom")
 